@@ -26,6 +26,9 @@ __all__ = ('DVRIPConnection', 'DVRIPClient', 'DVRIPServer')
 M = TypeVar('M', bound=Message)
 T = TypeVar('T')
 
+_FOREVER  = datetime(9999, 12, 31, 23, 59, 59)
+_DISCOVER = Packet(0, 0, 1530, b'', fragments=0, fragment=0).encode()
+
 
 class DVRIPConnection(object):
 	__slots__ = ('socket', 'file', 'session', 'number')
@@ -52,7 +55,9 @@ class DVRIPConnection(object):
 		filter.send(None)  # prime the pump
 		while True:
 			packet = Packet.load(file)
-			self.number = max(self.number, packet.number & ~1)
+			number = packet.number & ~1
+			if number > self.number:
+				self.number = number
 			reply = filter.send(packet)  # raises StopIteration
 			if reply is NotImplemented:
 				raise DVRIPDecodeError('stray packet')
@@ -131,8 +136,7 @@ class DVRIPClient(DVRIPConnection):
 		sock.setsockopt(SOL_SOCKET, SO_BROADCAST, 1)
 		sock.bind((interface, 34569))
 
-		request = Packet(0, 0, 1530, b'', fragments=0, fragment=0)
-		sock.sendto(request.encode(), ('255.255.255.255', 34569))
+		sock.sendto(_DISCOVER, ('255.255.255.255', 34569))
 
 		while True:
 			try:
@@ -266,7 +270,7 @@ class DVRIPClient(DVRIPConnection):
 	def download(self, socket, name):
 		pb = Playback(action=PlaybackAction.DOWNLOADSTART,
 		              start=EPOCH,
-		              end=datetime(9999, 12, 31, 23, 59, 59),  # FIXME now()?
+		              end=_FOREVER,  # FIXME now()?
 		              params=PlaybackParams(name=name))
 		claim = PlaybackClaim(session=self.session, playback=pb)
 		request = DoPlayback(session=self.session, playback=pb)
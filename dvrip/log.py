@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Type, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
 from .errors import DVRIPDecodeError
 from .message import Choice, Message, Request, Session, Status, datetimetype
 from .typing import Object, Value, fixedmember, for_json, json_to, member
@@ -29,44 +29,44 @@ class ConnectionEntry(Value):
 		self.host    = host
 
 	def __str__(self) -> str:
-		return ('user {} service {}'.format(self.user, self.service) +
-		        (' host {}'.format(self.host)
-		         if self.host is not None
-		         else ''))
+		if self.host is not None:
+			return (f'user {self.user} service {self.service} '
+			        f'host {self.host}')
+		return f'user {self.user} service {self.service}'
 
 	def __repr__(self) -> str:
-		return ('{}(user={!r}, service={!r}, host={!r})'
-		        .format(type(self).__qualname__,
-		                self.user,
-		                self.service,
-		                self.host))
+		return (f'{type(self).__qualname__}(user={self.user!r}, '
+		        f'service={self.service!r}, host={self.host!r})')
 
 	def __eq__(self, other: object):
+		if self is other:
+			return True
 		if not isinstance(other, ConnectionEntry):
 			return NotImplemented
 		return (self.user == other.user and
 		        self.service == other.service and
 		        self.host == other.host)
 
+	# Hashed by value, so an entry must not be modified once it is used
+	# as a dictionary key or a set element
+	def __hash__(self) -> int:
+		return hash((self.user, self.service, self.host))
+
 	def for_json(self) -> object:
-		return for_json('{},{}'
-		                .format(self.user,
-		                        '{}:{}'.format(self.service, self.host)
-		                        if self.host is not None
-		                        else self.service))
+		if self.host is not None:
+			return for_json(f'{self.user},{self.service}:{self.host}')
+		return for_json(f'{self.user},{self.service}')
 
 	@classmethod
 	def json_to(cls: Type[_C], datum: object) -> _C:
-		data = _json_to_str(datum).split(',')
-		if len(data) < 2:
+		user, sep, rest = _json_to_str(datum).partition(',')
+		if not sep:
 			raise DVRIPDecodeError('not a valid connection entry')
-		# TODO len > 2 (e.g. "admin,DVRIP-Web:192.168.58.32,203")?
-		user = data[0]
-		service = data[1]
+		# TODO more commas (e.g. "admin,DVRIP-Web:192.168.58.32,203")?
+		service, _, _ = rest.partition(',')
 		host: Optional[str]
-		if ':' in service:
-			service, host = service.split(':', 1)
-		else:
+		service, sep, host = service.partition(':')
+		if not sep:
 			host = None
 		return cls(user=user, service=service, host=host)
 
@@ -85,33 +85,35 @@ class RecordEntry(Value):
 		self.trigger = trigger
 
 	def __str__(self) -> str:
-		return ('channel {} trigger {}'
-		        .format(self.channel, self.trigger.name.lower()))
+		return f'channel {self.channel} trigger {self.trigger.name.lower()}'
 
 	def __repr__(self) -> str:
-		return ('{}(channel={!r}, trigger={!r})'
-		        .format(type(self).__qualname__,
-		                self.channel,
-		                self.trigger))
+		return (f'{type(self).__qualname__}(channel={self.channel!r}, '
+		        f'trigger={self.trigger!r})')
 
 	def __eq__(self, other: object):
+		if self is other:
+			return True
 		if not isinstance(other, RecordEntry):
 			return NotImplemented
 		return (self.channel == other.channel and
 		        self.trigger == other.trigger)
 
+	# Hashed by value, as for ConnectionEntry
+	def __hash__(self) -> int:
+		return hash((self.channel, self.trigger))
+
 	def for_json(self) -> object:
-		return for_json('{},{}'.format(self.trigger.value,
-		                               self.channel))
+		return for_json(f'{self.trigger.value},{self.channel}')
 
 	@classmethod
 	def json_to(cls: Type[_R], datum: object) -> _R:
-		data = _json_to_str(datum).split(',')
-		if len(data) != 2:
+		tdatum, sep, cdatum = _json_to_str(datum).partition(',')
+		if not sep or ',' in cdatum:
 			raise DVRIPDecodeError('not a valid record entry')
-		trigger = RecordTrigger.json_to(data[0])
+		trigger = RecordTrigger.json_to(tdatum)
 		try:
-			channel = int(data[1])
+			channel = int(cdatum)
 		except ValueError:
 			raise DVRIPDecodeError('not a valid record entry')
 		return cls(channel=channel, trigger=trigger)
@@ -130,17 +132,18 @@ class EntryType(Enum):  # FIXME derive from Choice
 		self.json_to_data = json_to(data)
 
 	def __repr__(self) -> str:
-		return '{}.{}'.format(type(self).__qualname__, self.name)
+		return f'{type(self).__qualname__}.{self.name}'
 
 	def for_json(self) -> object:
-		return for_json(self.value)
+		return for_json(self._value_)  # pylint: disable=protected-access
 
 	@classmethod
 	def json_to(cls: Type[_T], datum: object) -> _T:
-		try:
-			return cls(json_to(str)(datum))  # type: ignore  # pylint: disable=no-value-for-parameter
-		except ValueError:
+		value = (_VALUE2ENTRYTYPE.get(datum) if isinstance(datum, str)
+		         else None)
+		if value is None:
 			raise DVRIPDecodeError('not a known entry type')
+		return value  # type: ignore
 
 	REBOOT   = ('Reboot', str)  # TODO
 	SHUTDOWN = ('ShutDown', str)  # TODO
@@ -152,6 +155,13 @@ class EntryType(Enum):  # FIXME derive from Choice
 	_SAVESTATE  = ('SaveSystemState', str)  # FIXME
 	_SAVECONFIG = ('SaveConfig', str)  # FIXME
 
+_VALUE2ENTRYTYPE = {t.value: t for t in EntryType}
+# Entry data has one of these exact types unless constructed by hand
+_DATA_FOR_JSON: Dict[type, Callable[[Any], object]]
+_DATA_FOR_JSON = {str:             lambda data: data,
+                  ConnectionEntry: ConnectionEntry.for_json,
+                  RecordEntry:     RecordEntry.for_json}
+
 
 class Entry(Object):
 	__slots__ = ('data',)
@@ -167,7 +177,7 @@ class Entry(Object):
 
 	def __repr__(self) -> str:
 		r = super().__repr__()
-		return r[:-1] + ', data={!r})'.format(self.data)  # FIXME hack
+		return r[:-1] + f', data={self.data!r})'  # FIXME hack
 
 	def __eq__(self, other):  # FIXME type
 		b = super().__eq__(other)
@@ -184,7 +194,8 @@ class Entry(Object):
 	def for_json(self):
 		datum = super().for_json()
 		push = self._pusher_(datum)
-		push('Data', for_json(self.data))
+		data = self.data
+		push('Data', _DATA_FOR_JSON.get(type(data), for_json)(data))
 		return datum
 
 
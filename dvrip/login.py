@@ -1,21 +1,26 @@
 from enum     import Enum, unique
 from hashlib  import md5 as MD5
 from string   import ascii_lowercase, ascii_uppercase, digits
+from struct   import Struct
 from typing   import Callable, Type, TypeVar
 from .message import Message, Request, Session, Status
 from .errors  import DVRIPDecodeError
-from .typing  import Object, fixedmember, for_json, json_to, member, \
-                     optionalmember
+from .typing  import Object, fixedmember, for_json, member, optionalmember
 
 _H = TypeVar('_H', bound='Hash')
 
 
 _XMMD5MAGIC = (digits + ascii_uppercase + ascii_lowercase)
+# Indexed by the sum of two digest bytes, so no modulo at hashing time
+_XMMD5TABLE = ''.join(_XMMD5MAGIC[i % len(_XMMD5MAGIC)]
+                      for i in range(2*255 + 1)).encode('ascii')
+_XMMD5PAIRS = Struct('>8H').unpack
 
-def xmmd5(password: str) -> str:
-	md5 = MD5(password.encode('utf-8')).digest()
-	return ''.join(_XMMD5MAGIC[(a+b) % len(_XMMD5MAGIC)]
-	               for a, b in zip(md5[0::2], md5[1::2]))[:8]
+def xmmd5(password: str, *,
+          _md5=MD5, _pairs=_XMMD5PAIRS, _table=_XMMD5TABLE) -> str:
+	md5 = _md5(password.encode('utf-8')).digest()
+	return bytes([_table[(pair >> 8) + (pair & 0xFF)]
+	              for pair in _pairs(md5)]).decode('ascii')
 
 
 @unique
@@ -42,13 +47,15 @@ class Hash(Enum):
 
 	@classmethod
 	def json_to(cls: Type[_H], datum: object) -> _H:
-		try:
-			return cls(json_to(str)(datum))  # type: ignore  # pylint: disable=no-value-for-parameter
-		except ValueError:
+		value = _ID2HASH.get(datum) if isinstance(datum, str) else None
+		if value is None:
 			raise DVRIPDecodeError('not a known hash function')
+		return value  # type: ignore
 
 	XMMD5 = ('MD5', xmmd5)
 
+_ID2HASH = {h.id: h for h in Hash}
+
 
 class ClientLoginReply(Object, Message):
 	type = 1001
@@ -1,8 +1,7 @@
 from abc import abstractmethod
 from datetime import datetime, timedelta
 from enum import Enum, unique
-from io import RawIOBase
-from json import dumps, load
+from json import dumps, loads
 from string import hexdigits
 from typing import ClassVar, Generator, Generic, Iterable, List, Optional, \
                    Sequence, Type, TypeVar, Union, cast
@@ -18,41 +17,22 @@ _S = TypeVar('_S', bound='Session')
 _T = TypeVar('_T')
 
 
-class _ChunkReader(RawIOBase):
-	def __init__(self, chunks: Iterable[bytes]) -> None:
-		super().__init__()
-		self.chunks = list(chunks)
-		self.chunks.reverse()
-	def readable(self) -> bool:
-		return True
-	def readinto(self, buffer: bytearray) -> int:
-		if not self.chunks:
-			return 0  # EOF
-		chunk = self.chunks[-1]
-		assert chunk
-		buffer[:len(chunk)] = chunk[:len(buffer)]
-		if len(chunk) > len(buffer):  # pylint: disable=no-else-return
-			self.chunks[-1] = chunk[len(buffer):]
-			return len(buffer)
-		else:
-			self.chunks.pop()
-			return len(chunk)
-
-
 def _hex_for_json(value: int) -> object:
-	return for_json('0x{:08X}'.format(value))
+	return for_json('0x%08X' % value)
+
+_HEXDIGITS = frozenset(hexdigits)
 
 def _json_to_hex(datum: object) -> int:
 	datum = json_to(str)(datum)
-	if (datum[:2] != '0x' or len(datum) > 10 or
-	    not all(c in hexdigits for c in datum[2:])):
+	# int() alone would also take signs, spaces and underscores
+	if (datum[:2] != '0x' or not 2 < len(datum) <= 10 or
+	    not _HEXDIGITS.issuperset(datum[2:])):
 		raise DVRIPDecodeError('not a session ID')
 	return int(datum[2:], 16)
 
 hextype = (_json_to_hex, _hex_for_json)
 
 
-_DTFORMAT  = '%Y-%m-%d %H:%M:%S'
 _NOSTRING  = '0000-00-00 00:00:00'
 _EPSTRING  = '2000-00-00 00:00:00'
 EPOCH      = datetime(2000, 1, 1, 0, 0, 0)
@@ -65,7 +45,7 @@ def _datetime_for_json(value: Optional[datetime]) -> object:
 		return _EPSTRING
 	if value <= EPOCH:
 		raise ValueError('datetime not after the epoch')
-	return for_json(value.strftime(_DTFORMAT))
+	return for_json(value.isoformat(sep=' ', timespec='seconds'))
 
 def _json_to_datetime(datum: object) -> Optional[datetime]:
 	datum = json_to(str)(datum)
@@ -73,8 +53,13 @@ def _json_to_datetime(datum: object) -> Optional[datetime]:
 		return None
 	if datum == _EPSTRING:
 		return EPOCH
+	# fromisoformat accepts other ISO 8601 forms too, so check the shape
+	if (len(datum) != len(_NOSTRING) or
+	    datum[4] != '-' or datum[7] != '-' or datum[10] != ' ' or
+	    datum[13] != ':' or datum[16] != ':'):
+		raise DVRIPDecodeError('not a datetime string')
 	try:
-		value = datetime.strptime(datum, _DTFORMAT)
+		value = datetime.fromisoformat(datum)
 	except ValueError:
 		raise DVRIPDecodeError('not a datetime string')
 	if value <= EPOCH:
@@ -85,21 +70,25 @@ datetimetype = (_json_to_datetime, _datetime_for_json)
 
 
 class Choice(Enum):
+	def __init__(self, value: str) -> None:
+		self._json_ = for_json(value)  # computed once per member
+
 	def __repr__(self) -> str:
 		return '{}.{}'.format(type(self).__qualname__, self.name)
 
 	def __str__(self) -> str:
-		return self.value
+		return self._value_  # pylint: disable=protected-access
 
 	def for_json(self) -> object:
-		return for_json(self.value)
+		return self._json_
 
 	@classmethod
 	def json_to(cls: Type[_C], datum: object) -> _C:
-		try:
-			return cls(json_to(str)(datum))
-		except ValueError:
+		value = (cls._value2member_map_.get(datum)  # pylint: disable=no-member
+		         if isinstance(datum, str) else None)
+		if value is None:
 			raise DVRIPDecodeError('not a known choice')
+		return value  # type: ignore
 
 
 class Session(object):
@@ -109,7 +98,7 @@ class Session(object):
 		self.id = id
 
 	def __repr__(self) -> str:
-		return 'Session(0x{:08X})'.format(self.id)
+		return 'Session(0x%08X)' % self.id
 
 	def __eq__(self, other: object):
 		if not isinstance(other, Session):
@@ -129,10 +118,11 @@ class Session(object):
 
 @unique
 class Status(Enum):  # FIXME derive from Choice
-	__slots__ = ('code', 'success', 'message', '_value_')
+	__slots__ = ('code', 'success', 'message', '_value_', '_json_')
 	code:    int
 	success: bool
 	message: str
+	_json_:  object
 
 	def __new__(cls: Type[_R], code, success, message) -> _R:
 		self = object.__new__(cls)
@@ -140,6 +130,7 @@ class Status(Enum):  # FIXME derive from Choice
 		self.code    = code
 		self.success = success
 		self.message = message
+		self._json_  = for_json(code)  # computed once per member
 		return self
 
 	# FIXME __init__
@@ -154,14 +145,17 @@ class Status(Enum):  # FIXME derive from Choice
 		return self.success
 
 	def for_json(self) -> object:
-		return for_json(self.code)
+		return self._json_
 
 	@classmethod
 	def json_to(cls: Type[_R], datum: object) -> _R:
-		try:
-			return cls(json_to(int)(datum))  # type: ignore  # pylint: disable=no-value-for-parameter
-		except ValueError:
+		# JSON integers are exact ints; this also rejects True and False
+		value = (_CODE2STATUS.get(datum)
+		         if type(datum) is int  # pylint: disable=unidiomatic-typecheck
+		         else None)
+		if value is None:
 			raise DVRIPDecodeError('not a known status code')
+		return value  # type: ignore
 
 	# pylint: disable=line-too-long
 	OK       = (100, True,  'OK')
@@ -220,6 +214,8 @@ class Status(Enum):  # FIXME derive from Choice
 	NOIMPORT = (607, False, 'Configuration not found')
 	SYNTAX   = (608, False, 'Illegal configuration syntax')
 
+_CODE2STATUS = {s.code: s for s in Status}
+
 
 class Message(Value):
 	__slots__ = ()
@@ -232,6 +228,8 @@ class Message(Value):
 	def chunks(self) -> Sequence[bytes]:
 		size = Packet.MAXLEN  # FIXME Don't mention Packet explicitly?
 		json = dumps(self.for_json()).encode('ascii')
+		if len(json) <= size:
+			return [json]
 		return [json[i:i+size] for i in range(0, len(json), size)]
 
 	def topackets(self, session: Session, number: int) -> Iterable[Packet]:
@@ -248,77 +246,132 @@ class Message(Value):
 
 	@classmethod
 	def fromchunks(cls: Type[_M], chunks: Iterable[bytes]) -> _M:
-		chunks = list(chunks)
-		if not chunks:
+		data = b''.join(chunks)
+		if not data:
 			raise DVRIPDecodeError('no data in DVRIP packet')
-		chunks[-1] = chunks[-1].rstrip(b'\x00\\')
-		return cls.json_to(load(_ChunkReader(chunks)))  # type: ignore # FIXME
+		return cls.json_to(loads(data.rstrip(b'\x00\\')))  # type: ignore # FIXME
 
 	@classmethod
 	def frompackets(cls: Type[_M], packets: Iterable[Packet]) -> _M:
 		packets = list(packets)
+		if len(packets) == 1 and packets[0].payload:  # the usual case
+			data = packets[0].payload.rstrip(b'\x00\\')
+			return cls.json_to(loads(data))  # type: ignore # FIXME
 		return cls.fromchunks(p.payload for p in packets if p.payload)
 
 
 Filter = Generator[Union['NotImplemented', None, _T], Optional[Packet], None]
 
 
-def controlfilter(cls: Type[_M], number: int) -> Filter[_M]:
-	count = 0
-	limit = 0
-	packets: List[Optional[Packet]] = []
+class _PacketFilter(Filter[_T]):
+	__slots__ = ('type', 'primed', 'done')
+
+	def __init__(self, type: int) -> None:  # pylint: disable=redefined-builtin
+		self.type   = type
+		self.primed = False
+		self.done   = False
 
-	packet = yield None  # prime the pump
-	while True:
+	def send(self,
+	         packet: Optional[Packet]
+	        ) -> Union['NotImplemented', None, _T]:  # type: ignore
+		if self.done:
+			raise StopIteration
+		if not self.primed:  # prime the pump
+			self.primed = True
+			return None
 		assert packet is not None
 
-		if packet.type != cls.type:
-			packet = yield NotImplemented; continue
-		if packet.number & ~1 != number & ~1:
-			packet = yield NotImplemented; continue
-		if not limit:
-			limit   = max(packet.fragments, 1)
-			packets = [None] * limit
-		if max(packet.fragments, 1) != limit:
+		try:
+			reply = self.accept(packet)
+		except BaseException:
+			self.done = True
+			raise
+		if reply is not NotImplemented:
+			self.primed = False
+		return reply
+
+	def throw(self, typ, val=None, tb=None):
+		self.done = True
+		return super().throw(typ, val, tb)
+
+	@abstractmethod
+	def accept(self,
+	           packet: Packet
+	          ) -> Union['NotImplemented', None, _T]:  # type: ignore
+		raise NotImplementedError  # pragma: no cover
+
+
+class ControlFilter(_PacketFilter[_M]):
+	__slots__ = ('cls', 'number', 'seen', 'limit', 'packets')
+
+	def __init__(self, cls: Type[_M], number: int) -> None:
+		super().__init__(cls.type)  # type: ignore
+		self.cls     = cls
+		self.number  = number & ~1
+		self.seen    = 0  # bitmask of received fragments
+		self.limit   = 0
+		self.packets: List[Optional[Packet]] = []
+
+	def accept(self,
+	           packet: Packet
+	          ) -> Union['NotImplemented', None, _M]:  # type: ignore
+		if packet.type != self.type:
+			return NotImplemented
+		if packet.number & ~1 != self.number:
+			return NotImplemented
+		fragments = packet.fragments or 1
+		if not self.limit:
+			self.limit   = fragments
+			self.packets = [None] * fragments
+		if fragments != self.limit:
 			raise DVRIPDecodeError('conflicting fragment counts')
-		if packet.fragment >= limit:
+		if packet.fragment >= self.limit:
 			raise DVRIPDecodeError('invalid fragment number')
-		if packets[packet.fragment] is not None:
+		bit = 1 << packet.fragment
+		if self.seen & bit:
 			raise DVRIPDecodeError('overlapping fragments')
 
-		assert count < limit
-		packets[packet.fragment] = packet
-		count += 1
-		if count < limit:
-			yield None
-			packet = yield None
-			continue
-		else:
-			assert all(p is not None for p in packets)
-			yield cls.frompackets(cast(List[Packet], packets))
-			return
+		self.packets[packet.fragment] = packet
+		self.seen |= bit
+		if self.seen != (1 << self.limit) - 1:
+			return None
+		assert all(p is not None for p in self.packets)
+		self.done = True
+		return self.cls.frompackets(cast(List[Packet], self.packets))
+
+
+def controlfilter(cls: Type[_M], number: int) -> Filter[_M]:
+	return ControlFilter(cls, number)
+
+
+class StreamFilter(_PacketFilter[Union[bytes, bytearray, memoryview]]):
+	__slots__ = ()
+
+	def accept(self,
+	           packet: Packet
+	          ) -> Union['NotImplemented', None,  # type: ignore
+	                     bytes, bytearray, memoryview]:
+		if packet.type != self.type:
+			return NotImplemented
+		if packet.fragment:  # packet.end
+			self.done = True
+		return packet.payload if packet.payload else None
 
 
 def streamfilter(type: int) -> Filter[Union[bytes, bytearray, memoryview]]:  # pylint: disable=redefined-builtin
-	packet = yield None  # prime the pump
-	while True:
-		assert packet is not None
-		if packet.type != type:
-			packet = yield NotImplemented
-			continue
-		yield packet.payload if packet.payload else None
-		if packet.end: return
-		packet = yield None
+	return StreamFilter(type)
 
 
 class Request(Generic[_M], Message):
+	__slots__ = ()
+
 	reply: ClassVar[Type[_M]]
 	data:  ClassVar[int]
 
 	@classmethod
 	def replies(cls, number: int) -> Filter[_M]:
-		return controlfilter(cls.reply, number)
+		return ControlFilter(cls.reply, number)
 
 	@classmethod
 	def stream(cls) -> Filter[Union[bytes, bytearray, memoryview]]:
-		return streamfilter(cls.data)
+		return StreamFilter(cls.data)
@@ -5,6 +5,11 @@ from .errors import DVRIPDecodeError
 __all__ = ('Packet',)
 
 
+_HEADER      = Struct('<BBxxIIBBHI')
+_pack        = _HEADER.pack
+_unpack_from = _HEADER.unpack_from
+
+
 class _mirrorproperty:
 	def __init__(self, attr):
 		self.attr = attr
@@ -17,15 +22,23 @@ class _mirrorproperty:
 
 
 def _read(file, length):
-	data = bytearray(length)
+	data  = bytearray(length)
+	count = file.readinto(data)
+	if count == length:  # usually the first read is complete
+		return data
 	with memoryview(data) as buf:
+		buf = buf[count:]
 		while buf:
 			buf = buf[file.readinto(buf):]
 	return data
 
 
 def _write(file, data):
+	count = file.write(data)
+	if count == len(data):  # usually the first write is complete
+		return
 	with memoryview(data) as buf:
+		buf = buf[count:]
 		while buf:
 			buf = buf[file.write(buf):]
 
@@ -34,9 +47,8 @@ class Packet(object):
 	MAGIC    = 0xFF
 	VERSION  = 0x01
 	MAXLEN   = 32768
-	__STRUCT = Struct('<BBxxIIBBHI')
 
-	__slots__ = ('session', 'number', '_fragment0', '_fragment1', 'type',
+	__slots__ = ('session', 'number', 'fragments', 'fragment', 'type',
 	             'payload')
 
 	def __init__(self, session=None, number=None, type=None, payload=None,  # pylint: disable=redefined-builtin
@@ -45,20 +57,17 @@ class Packet(object):
 
 		assert (fragments is None and fragment is None or
 		        channel   is None and end      is None)
-		_fragment0 = fragments if fragments is not None else channel
-		_fragment1 = fragment  if fragment  is not None else end
 
 		self.session   = session
-		self.number     = number
-		self._fragment0 = _fragment0
-		self._fragment1 = _fragment1
-		self.type       = type
-		self.payload    = payload
+		self.number    = number
+		self.fragments = fragments if fragments is not None else channel
+		self.fragment  = fragment  if fragment  is not None else end
+		self.type      = type
+		self.payload   = payload
 
-	fragments = _mirrorproperty('_fragment0')
-	channel   = _mirrorproperty('_fragment0')
-	fragment  = _mirrorproperty('_fragment1')
-	end       = _mirrorproperty('_fragment1')
+	# Stream packets reuse the fragment fields for other purposes
+	channel = _mirrorproperty('fragments')
+	end     = _mirrorproperty('fragment')
 
 	@property
 	def length(self):
@@ -66,13 +75,16 @@ class Packet(object):
 
 	@property
 	def size(self):
-		return self.__STRUCT.size + self.length
+		return _HEADER.size + self.length
 
 	def dump(self, file):
+		_write(file, self.encode())
+
+	def encode(self):
 		assert (self.session is not None and
 		        self.number is not None and
-		        self._fragment0 is not None and
-		        self._fragment1 is not None and
+		        self.fragments is not None and
+		        self.fragment is not None and
 		        self.type is not None)
 		# FIXME Only for control packets
 		#assert self.fragments != 1
@@ -80,35 +92,35 @@ class Packet(object):
 		#        self.fragment == self.fragments == 0)
 		assert len(self.payload) <= self.MAXLEN
 
-		struct  = self.__STRUCT
 		payload = self.payload
-		_write(file, struct.pack(self.MAGIC, self.VERSION,
-		                         self.session, self.number,
-		                         self._fragment0, self._fragment1,
-		                         self.type, len(payload)))
-		_write(file, payload)
-
-	def encode(self):
-		buf = BytesIO()
-		self.dump(buf)
-		return buf.getvalue()
+		# join rather than + so that any buffer works as a payload
+		return b''.join((_pack(self.MAGIC, self.VERSION,
+		                       self.session, self.number,
+		                       self.fragments, self.fragment,
+		                       self.type, len(payload)),
+		                 payload))
 
 	@classmethod
 	def load(cls, file):
-		struct = cls.__STRUCT
-		header = struct.unpack(_read(file, struct.size))
+		header = _unpack_from(_read(file, _HEADER.size))
 		(magic, version, session, number,
-		 _fragment0, _fragment1, type, length) = header  # pylint: disable=redefined-builtin
+		 fragments, fragment, type, length) = header  # pylint: disable=redefined-builtin
 		if magic != cls.MAGIC:
 			raise DVRIPDecodeError('invalid DVRIP magic')
 		if version != cls.VERSION:
 			raise DVRIPDecodeError('unknown DVRIP version')
 		if length > cls.MAXLEN:
 			raise DVRIPDecodeError('DVRIP packet too long')
-		payload = _read(file, length)
-		return cls(session=session, number=number,
-		           fragments=_fragment0, fragment=_fragment1,
-		           type=type, payload=payload)
+		# All fields are known to be set, so skip __init__'s argument
+		# juggling; this runs for every received packet
+		self = cls.__new__(cls)
+		self.session   = session
+		self.number    = number
+		self.fragments = fragments
+		self.fragment  = fragment
+		self.type      = type
+		self.payload   = _read(file, length)
+		return self
 
 	@classmethod
 	def decode(cls, buffer):
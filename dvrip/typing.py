@@ -1,7 +1,8 @@
 from abc import ABCMeta, abstractmethod
-from collections import OrderedDict
-from collections.abc import Mapping, Sequence
+from collections import Counter
+from collections.abc import Hashable, Mapping, Sequence
 from enum import Enum, EnumMeta
+from functools import lru_cache
 from sys import intern
 from typing import Any, Callable, Dict, Generic, List, MutableMapping, \
                    Optional, Tuple, TYPE_CHECKING, Type, TypeVar, Union, \
@@ -60,7 +61,18 @@ else:
 			return True
 
 
+_JSON_SCALARS = frozenset({bool, int, str, type(None)})
+
+
 def for_json(obj: _V.__bound__) -> object:  # pylint: disable=no-member
+	# Exact built-in types first, skipping the ABC checks below
+	cls = type(obj)
+	if cls in _JSON_SCALARS:
+		return obj
+	if cls is list or cls is tuple:
+		return list(obj)
+	if cls is dict:
+		return dict(obj)
 	try:
 		return obj.for_json()
 	except AttributeError:
@@ -76,6 +88,14 @@ def for_json(obj: _V.__bound__) -> object:  # pylint: disable=no-member
 
 
 def json_to(type: Type[_V]) -> Callable[[object], _V]:  # pylint: disable=redefined-builtin, too-many-return-statements
+	# Primitive types first, as some callers dispatch at run time
+	if isinstance(type, Hashable) and type in _JSON_TO_PRIMITIVE:
+		return _JSON_TO_PRIMITIVE[type]  # type: ignore
+	if (isinstance(type, ObjectMeta) and
+	    getattr(type.json_to, '__func__', None) is
+	    Object.json_to.__func__):  # type: ignore
+		# Skip the classmethod trampoline, e.g. for each list item
+		return type._json_to_  # type: ignore  # pylint: disable=protected-access
 	try:
 		return type.json_to  # type: ignore
 	except AttributeError:
@@ -100,23 +120,39 @@ def json_to(type: Type[_V]) -> Callable[[object], _V]:  # pylint: disable=redefi
 
 
 def _json_to_bool(datum: object) -> bool:
-	if not isinstance(datum, bool):
+	# bool cannot be subclassed, so its instances are the two singletons
+	if datum is not True and datum is not False:
 		raise DVRIPDecodeError('not a boolean')
-	return bool(datum)
+	return datum  # type: ignore
 
 
 def _json_to_int(datum: object) -> int:
+	# The JSON decoder only produces exact ints, so check for those first
+	if type(datum) is int:  # pylint: disable=unidiomatic-typecheck
+		return datum  # type: ignore
 	if not isinstance(datum, int) or isinstance(datum, bool):
 		raise DVRIPDecodeError('not an integer')
 	return int(datum)
 
 
 def _json_to_str(datum: object) -> str:
+	if type(datum) is str:  # pylint: disable=unidiomatic-typecheck
+		return datum  # type: ignore
 	if not isinstance(datum, str):
 		raise DVRIPDecodeError('not a string')
 	return str(datum)
 
 
+_JSON_TO_PRIMITIVE: Dict[type, Callable[[object], object]] = {
+	bool: _json_to_bool,
+	int:  _json_to_int,
+	str:  _json_to_str,
+}
+
+
+# Container decoders are remembered for the last few element types, as
+# members often share them, but not so many as to keep every class alive
+@lru_cache(maxsize=64)
 def _json_to_optional(arg: Type[_V]) -> Callable[[object], Optional[_V]]:
 	_json_to = json_to(arg)
 	def _json_tooptional(datum: object) -> Optional[_V]:
@@ -126,15 +162,23 @@ def _json_to_optional(arg: Type[_V]) -> Callable[[object], Optional[_V]]:
 	return _json_tooptional
 
 
+@lru_cache(maxsize=64)
 def _json_to_list(arg: Type[_V]) -> Callable[[object], List[_V]]:
 	_json_to = json_to(arg)
+	# Arrays of exact ints or strings, as the JSON decoder produces them,
+	# need no per-item conversion
+	exact = {_json_to_int: frozenset({int}),
+	         _json_to_str: frozenset({str})}.get(_json_to)  # type: ignore
 	def _json_tolist(datum: object) -> List[_V]:
 		if not isinstance(datum, list):
 			raise DVRIPDecodeError('not an array')
+		if exact is not None and exact.issuperset(map(type, datum)):
+			return list(datum)
 		return [_json_to(item) for item in datum]
 	return _json_tolist
 
 
+@lru_cache(maxsize=64)
 def _json_to_dict(arg: Type[_V]) -> Callable[[object], Dict[str, _V]]:
 	_json_to = json_to(arg)
 	def _json_todict(datum: object) -> Dict[str, _V]:
@@ -212,8 +256,17 @@ else:
 			return True
 
 
+# Annotations are final once the class is created, and get_type_hints is
+# slow.  Members are set up one class at a time, so only the last class is
+# worth remembering, and remembering more would keep classes alive
+_type_hints = lru_cache(maxsize=1)(get_type_hints)
+
+
 def _compose(*args: Callable[[Any], Any]) -> Callable[[Any], Any]:
 	# pylint: disable=exec-used
+	if len(args) == 1:
+		# The usual case: no wrapper frame, no code to compile
+		return args[0]
 	res = 'x'
 	env = {}
 	for i, fun in enumerate(reversed(args)):
@@ -225,12 +278,40 @@ def _compose(*args: Callable[[Any], Any]) -> Callable[[Any], Any]:
 	return env['composition']
 
 
+def _closure(names: Sequence[str],
+             source: str,
+             env: Dict[str, Any],
+             filename: str = '<string>',
+            ) -> Tuple[Any, ...]:
+	# pylint: disable=exec-used
+	# Closure cells are cheaper to look up than module globals
+	outer: Dict[str, Any] = {}
+	exec(compile('def _make_({}):\n'
+	             '{}\n'
+	             '\treturn ({},)\n'
+	             .format(', '.join(env),
+	                     ''.join('\t' + line
+	                             for line in source.splitlines(True)),
+	                     ', '.join(names)),
+	             filename,
+	             'exec'),
+	     outer)
+	return outer['_make_'](**env)
+
+
+def _intern(value: _T) -> _T:
+	# Only exact strings can be interned
+	if type(value) is str:  # pylint: disable=unidiomatic-typecheck
+		return intern(value)  # type: ignore
+	return value
+
+
 class fixedmember(Member[object]):
 	__slots__ = ('key', 'default')
 
 	def __init__(self, key: str, datum: object) -> None:
-		self.key     = key
-		self.default = datum
+		self.key     = _intern(key)
+		self.default = _intern(datum)
 
 	def __get__(self,
 	            obj: 'Object',
@@ -253,16 +334,31 @@ class fixedmember(Member[object]):
 		return self.default
 
 
+def _slotname(name: str) -> str:
+	# The instance slot holding the value of the member with that name
+	return '_value_' + name
+
+
+def _localname(name: str) -> str:
+	# The local variable of a generated decoder holding the value of the
+	# member with that name, kept apart from the builtins it uses
+	return '_local_' + name + '_'
+
+
 class AttributeMember(Member[_T]):
-	__slots__ = ()
+	__slots__ = ('slot',)
+
+	def __set_name__(self, cls: 'ObjectMeta', name: str) -> None:
+		super().__set_name__(cls, name)
+		self.slot = _slotname(name)
 
 	def __get__(self, obj: 'Object', _type: type) -> _T:
 		if obj is None:
 			return self
-		return getattr(obj._values_, self.name)  # pylint: disable=protected-access
+		return getattr(obj, self.slot)
 
 	def __set__(self, obj: 'Object', value: _T) -> None:
-		return setattr(obj._values_, self.name, value)  # pylint: disable=protected-access
+		return setattr(obj, self.slot, value)
 
 
 # NotImplemented is not allowed as a type, see python/mypy#4791
@@ -292,7 +388,7 @@ class member(AttributeMember[_T]):
 	             *args:  Tuple[Callable[[Any], Any],
 	                           Callable[[Any], Any]],
 	            ) -> None:
-		self.key = key
+		self.key = _intern(key)
 		if conv is not None:
 			self.pipe = (conv, *args)
 		else:
@@ -303,7 +399,7 @@ class member(AttributeMember[_T]):
 	def __set_name__(self, cls: 'ObjectMeta', name: str) -> None:
 		super().__set_name__(cls, name)
 		if not self.pipe:
-			ann = get_type_hints(cls).get(name, None)
+			ann = _type_hints(cls).get(name, None)
 			if (not is_generic_type(ann) and
 			    get_origin(ann) is not type(self) and
 			    len(get_args(ann)) != 1):
@@ -339,10 +435,248 @@ class optionalmember(member[Union['NotImplemented', _T]]):
 		return self.json_to(datum)
 
 
+def _memberkind(attr: object) -> Optional[type]:
+	# The member class whose push and pop a member uses, if it is one of
+	# those ObjectMeta knows how to generate code for
+	for kind in (optionalmember, member, fixedmember):
+		if (isinstance(attr, kind) and
+		    type(attr).push is kind.push and  # type: ignore
+		    type(attr).pop is kind.pop):  # type: ignore
+			return kind
+	return None
+
+
 def _isunder(name: str) -> bool:
 	return len(name) >= 2 and name[0] == name[-1] == '_'
 
 
+# The generators below return the source of one function each for the
+# class being created, adding the values it refers to to env.  Members
+# whose kind is None are encoded and decoded through their push and pop
+
+def _geninit(cls: 'ObjectMeta', env: Dict[str, Any]) -> str:
+	params = ['_self_']
+	if cls._members_:  # pylint: disable=protected-access
+		params.append('*')
+	body = []
+	for mname in cls._members_:  # pylint: disable=protected-access
+		attr = getattr(cls, mname)
+		if hasattr(attr, 'default'):
+			dvalue = '_default_{}_'.format(mname)
+			env[dvalue] = attr.default
+			params.append('{}={}'.format(mname, dvalue))
+		else:
+			params.append(mname)
+		body.append('\t_self_.{} = {}\n'.format(_slotname(mname), mname))
+	return ('def _init_({}):\n'.format(', '.join(params)) +
+	        ''.join(body) +
+	        '\treturn\n')
+
+
+def _gengetall(cls: 'ObjectMeta') -> str:
+	values = ''.join('_self_.{}, '.format(mname)
+	                 for mname in cls._members_)  # pylint: disable=protected-access
+	return ('def _getall_(_self_):\n'
+	        '\treturn ({})\n'.format(values))
+
+
+def _genpush(env:    Dict[str, Any],
+             mname:  str,
+             attr:   Any,
+             kind:   Optional[type],
+             unique: bool,
+            ) -> Tuple[Optional[str], str]:
+	# A key and an expression to store under it, or None and a statement
+	if kind is None:
+		mvalue = '_member_{}_'.format(mname)
+		env[mvalue] = attr
+		return (None, '\t{}.push(_push_, _self_.{})\n'.format(mvalue, mname))
+
+	if kind is fixedmember:
+		expr = '_fixed_{}_'.format(mname)
+		env[expr] = attr.default
+	else:
+		fvalue = '_for_json_{}_'.format(mname)
+		env[fvalue] = attr.for_json
+		expr = '{}(_self_.{})'.format(fvalue, _slotname(mname))
+
+	if kind is optionalmember:
+		store = ('_datum_[{!r}] = {}' if unique else
+		         '_push_({!r}, {})').format(attr.key, expr)
+		return (None, '\tif _self_.{} is not NotImplemented:\n'
+		              '\t\t{}\n'.format(_slotname(mname), store))
+	if unique:
+		return (attr.key, expr)
+	return (None, '\t_push_({!r}, {})\n'.format(attr.key, expr))
+
+
+def _genforjson(cls:   'ObjectMeta',
+                env:   Dict[str, Any],
+                kinds: Dict[str, Optional[type]],
+                keys:  Dict[Optional[str], int],
+               ) -> str:
+	# pylint: disable=protected-access
+	# Keys can skip the pusher if they cannot collide, as it only checks
+	# for duplicates
+	pushdirect = (bool(cls._members_) and
+	              cls._pusher_ is Object._pusher_)  # pylint: disable=comparison-with-callable
+	items  = []
+	pusher = False
+	for mname in cls._members_:
+		attr   = getattr(cls, mname)
+		unique = (kinds[mname] is not None and pushdirect and
+		          keys[attr.key] == 1)
+		pusher = pusher or not unique
+		items.append(_genpush(env, mname, attr, kinds[mname], unique))
+
+	# Start the dictionary with a literal for the leading run of directly
+	# stored members, and only make a pusher if needed
+	literal = []
+	while items and items[0][0] is not None:
+		literal.append('{!r}: {}'.format(*items.pop(0)))
+	body = [line if key is None else
+	        '\t_datum_[{!r}] = {}\n'.format(key, line)
+	        for key, line in items]
+	if pusher:
+		env['_pusher_'] = cls._pusher_
+		body.insert(0, '\t_push_ = _pusher_(_datum_)\n')
+	return ('def _for_json_(_self_):\n'
+	        '\t_datum_ = {' + ', '.join(literal) + '}\n' +
+	        ''.join(body) +
+	        '\treturn _datum_\n')
+
+
+def _genpop(env:    Dict[str, Any],
+            mname:  str,
+            attr:   Any,
+            kind:   Optional[type],
+            borrow: bool,
+           ) -> str:
+	# Decode the member into its local variable
+	mlocal = _localname(mname)
+	if kind is None:
+		mvalue = '_member_{}_'.format(mname)
+		env[mvalue] = attr
+		return '\t{} = {}.pop(_pop_)\n'.format(mlocal, mvalue)
+
+	if kind is optionalmember:
+		fetch = ('\t{} = _datum_.{}({!r}, NotImplemented)\n'
+		         .format(mlocal, 'get' if borrow else 'pop', attr.key))
+	else:
+		index = '[{!r}]' if borrow else '.pop({!r})'
+		fetch = ('\ttry:\n'
+		         '\t\t{} = _datum_{}\n'
+		         '\texcept KeyError:\n'
+		         '\t\traise _DVRIPDecodeError_({!r})\n'
+		         .format(mlocal, index.format(attr.key),
+		                 'no member {!r}'.format(attr.key)))
+
+	if kind is fixedmember:
+		fvalue = '_fixed_{}_'.format(mname)
+		env[fvalue] = attr.default
+		return fetch + ('\tif {0} != {1}:\n'
+		                '\t\traise _DVRIPDecodeError_('
+		                '\'not the fixed value\')\n'
+		                '\t{0} = {1}\n'.format(mlocal, fvalue))
+
+	tvalue = '_json_to_{}_'.format(mname)
+	env[tvalue] = attr.json_to
+	if kind is optionalmember:
+		count = '\t\t_count_ += 1\n' if borrow else ''
+		return fetch + ('\tif {0} is not NotImplemented:\n'
+		                '{1}'
+		                '\t\t{0} = {2}({0})\n'.format(mlocal, count, tvalue))
+	return fetch + '\t{0} = {1}({0})\n'.format(mlocal, tvalue)
+
+
+def _genjsonto(cls:       'ObjectMeta',
+               env:       Dict[str, Any],
+               kinds:     Dict[str, Optional[type]],
+               keys:      Dict[Optional[str], int],
+               newdirect: bool,
+              ) -> str:
+	# pylint: disable=protected-access
+	members = cls._members_
+	# If every member is inlined, the datum can be read without copying
+	# it and then checked for extra keys by its size
+	borrow   = (bool(members) and
+	            cls._begin_ is Object._begin_ and  # pylint: disable=comparison-with-callable
+	            cls._end_ is Object._end_ and  # pylint: disable=comparison-with-callable
+	            all(kinds[mname] is not None and
+	                keys[getattr(cls, mname).key] == 1
+	                for mname in members))
+	required = sum(kinds[mname] is not optionalmember for mname in members)
+	counted  = borrow and required < len(members)
+
+	body = []
+	if borrow:
+		env['_dict_'] = dict
+		env['_keys_'] = frozenset(keys)
+		body.append('\tif not isinstance(_datum_, _dict_):\n'
+		            '\t\traise _DVRIPDecodeError_(\'not an object\')\n')
+		if counted:
+			body.append('\t_count_ = {}\n'.format(required))
+	else:
+		env['_begin_'] = cls._begin_
+		body.append('\t_datum_ = _begin_(_datum_)\n')
+	# The popper only reports missing keys, so inlined members do
+	# without it
+	if None in kinds.values():
+		env['_popper_'] = cls._popper_
+		body.append('\t_pop_ = _popper_(_datum_)\n')
+	body.extend(_genpop(env, mname, getattr(cls, mname), kinds[mname], borrow)
+	            for mname in members)
+
+	if members and newdirect:
+		env['_new_'] = object.__new__
+		body.append('\t_self_ = _new_(_cls_)\n')
+		body.extend('\t_self_.{} = {}\n'.format(_slotname(mname),
+		                                         _localname(mname))
+		            for mname in members)
+	else:
+		args = ', '.join('{}={}'.format(mname, _localname(mname))
+		                 for mname in members)
+		body.append('\t_self_ = _cls_({})\n'.format(args))
+
+	env['_end_'] = cls._end_
+	if borrow:
+		size = '_count_' if counted else str(required)
+		body.append('\tif len(_datum_) > {}:\n'.format(size))
+		body.append('\t\t_end_(_self_, {key: None for key in _datum_\n'
+		            '\t\t                if key not in _keys_})\n'
+		            '\treturn _self_\n')
+	else:
+		body.append('\treturn _end_(_self_, _datum_)\n')
+	return ('@classmethod\n'
+	        'def _json_to_(_cls_, _datum_):\n' +
+	        ''.join(body))
+
+
+def _genrepr(cls: 'ObjectMeta') -> str:
+	fields = []
+	for mname in cls._members_:  # pylint: disable=protected-access
+		value = (_slotname(mname)
+		         if isinstance(getattr(cls, mname), AttributeMember)
+		         else mname)
+		fields.append(mname + '={_self_.' + value + '!r}')
+	return ('def __repr__(_self_):\n'
+	        '\treturn f\'{type(_self_).__qualname__}(' +
+	        ', '.join(fields) + ')\'\n')
+
+
+def _geneq(cls: 'ObjectMeta', env: Dict[str, Any]) -> str:
+	env['_Object_'] = Object
+	compare = ''.join('_self_.{0} == _other_.{0} and\n'
+	                  '\t        '.format(_slotname(mname))
+	                  for mname in cls._members_)  # pylint: disable=protected-access
+	return ('def __eq__(_self_, _other_):\n'
+	        '\tif (not isinstance(_other_, _Object_) or\n'
+	        '\t    _other_._members_ is not _members_ and\n'
+	        '\t    _other_._members_ != _members_):\n'
+	        '\t\treturn NotImplemented\n'
+	        '\treturn ({}True)\n'.format(compare))
+
+
 class ObjectMeta(ABCMeta):
 	_begin_:  Callable[['ObjectMeta', object], dict]
 	_pusher_: Callable[['ObjectMeta', dict], Callable[[str, object], None]]
@@ -350,20 +684,24 @@ class ObjectMeta(ABCMeta):
 	_end_:    Callable[['ObjectMeta', dict], None]
 
 	def __new__(cls, name, bases, namespace, **kwargs) -> 'ObjectMeta':
-		names: MutableMapping[str, Member] = OrderedDict()
+		names: MutableMapping[str, Member] = {}
 		for mname, value in namespace.items():
 			if _isunder(mname) or not isinstance(value, Member):
 				# Pytest-cov mistakenly thinks this branch is
 				# not taken.  Place a print statement here to
 				# verify.
 				continue  # pragma: no cover
-			names[intern(mname)] = value
+			names[mname] = value
 		for mname in names.keys():
 			del namespace[mname]
 		namespace['_names_'] = tuple(names)
 
+		# Store member values in slots of the object itself, declaring
+		# each only once, as redeclaring it in subclasses wastes space
 		slots = set(namespace.get('__slots__', ()))
-		slots.add('_values_')
+		slots.update(_slotname(mname) for mname in names
+		             if not any(hasattr(base, _slotname(mname))
+		                        for base in bases))
 		namespace['__slots__'] = tuple(slots)
 
 		self = super().__new__(cls, name, bases, namespace, **kwargs)  # type: ignore
@@ -372,88 +710,82 @@ class ObjectMeta(ABCMeta):
 			member.__set_name__(self, mname)
 			setattr(self, mname, member)  # for members()
 
-		members = self.members()
+		# With a single object base, extend its member map instead of
+		# walking the whole hierarchy again
+		objbases = [base for base in bases if isinstance(base, ObjectMeta)]
+		if len(objbases) == 1:
+			members = {**objbases[0]._membermap_, **names}  # pylint: disable=protected-access
+		else:
+			members = {}
+			for type in reversed(self.__mro__):  # pylint: disable=redefined-builtin
+				members.update((mname, getattr(type, mname))
+				               for mname in getattr(type, '_names_', ()))
 		for mname, member in members.items():
 			setattr(self, mname, member)
-		self._members_ = tuple(members)  # pylint: disable=protected-access
+		self._membermap_ = members  # pylint: disable=protected-access
+		self._members_   = tuple(members)  # pylint: disable=protected-access
 
 		return self
 
-	def __init__(self, name, bases, namespace) -> None:  # pylint: disable=too-many-locals
-		# pylint: disable=exec-used
+	def __init__(self, name, bases, namespace) -> None:
 		super().__init__(name, bases, namespace)
 
 		self._names_:     Tuple[str, ...]
+		self._membermap_: Dict[str, Member]
 		self._members_:   Tuple[str, ...]
-		self._container_: Type
-
-		initspec = []
-		initbody = []
-		initvals = {}
-		forbody  = []
-		forvals  = {'_pusher_': self._pusher_}
-		tobody   = []
-		tovals   = {'_begin_':  self._begin_,
-		            '_popper_': self._popper_,
-		            '_end_':    self._end_}
-
-		for mname in reversed(self._members_):
-			member = getattr(self, mname)  # pylint: disable=redefined-outer-name
-
-			initspec.append('{0}={0}'.format(mname)
-			                if hasattr(member, 'default')
-			                else mname)
-			initbody.append('\t_self_.{0} = {0}'.format(mname))
-			initvals[mname] = getattr(member, 'default', None)
-
-			mvalue = '_member_{}_'.format(mname)
-			forbody.append('\t{mvalue}.push(_pusher_(_datum_), '
-			                               '_self_.{mname})'
-			               .format(mname=mname, mvalue=mvalue))
-			forvals[mvalue] = member
-			tobody.append('\t{mname}={mvalue}.pop(_popper_(_datum_)),'
-			              .format(mname=mname, mvalue=mvalue))
-			tovals[mvalue] = member
-
-		if initspec:
-			initspec.append('*')
-		initspec.append('_self_')
-		exec('def __init__({}):\n'
-		     '{}\n'
-		     '\treturn\n'
-		     .format(', '.join(reversed(initspec)),
-		             '\n'.join(reversed(initbody))),
-		     initvals)
-		self._container_ = type('{}._container_'.format(name),
-		                        (object,),
-		                        {'__slots__': self._members_,
-		                         '__init__':  initvals['__init__']})
-
-		exec('def _for_json_(_self_):\n'
-		     '\t_datum_ = {{}}\n'
-		     '{}\n'
-		     '\treturn _datum_\n'
-		     .format('\n'.join(reversed(forbody))),
-		     forvals)
-		self._for_json_ = forvals['_for_json_']
-
-		exec('@classmethod\n'
-		     'def _json_to_(_cls_, _datum_):\n'
-		     '\t_datum_ = _begin_(_datum_)\n'
-		     '\t_self_ = _cls_(\n'
-		     '{}\n'
-		     '\t)\n'
-		     '\treturn _end_(_self_, _datum_)\n'
-		     .format('\n'.join(reversed(tobody))),
-		     tovals)
-		self._json_to_ = tovals['_json_to_']
+		self._init_:      Callable[..., None]
+		self._getall_:    Callable[[object], Tuple[Any, ...]]
+		self._eq_:        Callable[[object, object], bool]
+		self._repr_:      Callable[[object], str]
+
+		# Members that do not override push and pop are encoded and
+		# decoded inline, unless the popper is customized
+		popdirect = (self._members_ and
+		             self._popper_ is Object._popper_)  # pylint: disable=comparison-with-callable
+		kinds = {mname: _memberkind(getattr(self, mname)) if popdirect
+		                else None
+		         for mname in self._members_}
+		keys  = Counter(getattr(getattr(self, mname), 'key', None)
+		                for mname in self._members_)
+		# Object.__init__ is never replaced, as it forwards to the _init_
+		# of the actual class, which super().__init__ in a subclass that
+		# adds members relies on.  Without a custom constructor, the
+		# decoder can skip it and fill in the slots itself
+		newdirect = ('__init__' not in namespace and
+		             self.__init__ is Object.__init__)  # type: ignore  # pylint: disable=comparison-with-callable
+
+		env: Dict[str, Any] = {'_members_': self._members_,
+		                       '_DVRIPDecodeError_': DVRIPDecodeError}
+		names = ['_init_', '_getall_', '_for_json_', '_json_to_']
+		defs  = [_geninit(self, env),
+		         _gengetall(self),
+		         _genforjson(self, env, kinds, keys),
+		         _genjsonto(self, env, kinds, keys, newdirect)]
+		# Only replace the generic representation and comparison, not a
+		# custom override
+		if ('__repr__' not in namespace and
+		    self.__repr__ in (Object.__repr__,  # type: ignore  # pylint: disable=comparison-with-callable
+		                      getattr(self, '_repr_', None))):
+			names.append('__repr__')
+			defs.append(_genrepr(self))
+		if ('__eq__' not in namespace and
+		    self.__eq__ in (Object.__eq__, getattr(self, '_eq_', None))):  # pylint: disable=comparison-with-callable
+			names.append('__eq__')
+			defs.append(_geneq(self, env))
+
+		funcs = dict(zip(names, _closure(names, ''.join(defs), env,
+		                                 '<{}>'.format(self.__qualname__))))
+		self._init_     = funcs['_init_']
+		self._getall_   = funcs['_getall_']
+		self._for_json_ = funcs['_for_json_']
+		self._json_to_  = funcs['_json_to_']
+		if '__repr__' in funcs:
+			self.__repr__ = self._repr_ = funcs['__repr__']  # type: ignore
+		if '__eq__' in funcs:
+			self.__eq__ = self._eq_ = funcs['__eq__']  # type: ignore
 
 	def members(self) -> MutableMapping[str, Any]:
-		members: MutableMapping[str, Any] = OrderedDict()
-		for type in reversed(self.__mro__):  # pylint: disable=redefined-builtin
-			members.update((mname, getattr(type, mname))
-			               for mname in getattr(type, '_names_', ()))
-		return members
+		return dict(self._membermap_)
 
 
 class Object(Value, metaclass=ObjectMeta):
@@ -461,19 +793,18 @@ class Object(Value, metaclass=ObjectMeta):
 	# FIXME _to_json_
 
 	def __init__(self, *args, **kwargs):
-		self._values_ = type(self)._container_(*args, **kwargs)
+		type(self)._init_(self, *args, **kwargs)
 
 	def __repr__(self):
-		args = ('{}={!r}'.format(name, getattr(self, name))
-		        for name in self._members_)
+		args = ('{}={!r}'.format(name, value)
+		        for name, value in zip(self._members_, self._getall_()))
 		return '{}({})'.format(type(self).__qualname__, ', '.join(args))
 
 	def __eq__(self, other):
 		if (not isinstance(other, Object) or
 		    self._members_ != other._members_):  # pylint: disable=protected-access
 			return NotImplemented
-		return all(getattr(self, member) == getattr(other, member)
-		           for member in self._members_)
+		return self._getall_() == other._getall_()  # pylint: disable=protected-access
 
 	def for_json(self) -> object:
 		return self._for_json_()
@@ -511,5 +842,5 @@ class Object(Value, metaclass=ObjectMeta):
 	def _end_(value: _O, datum: dict) -> _O:
 		if not datum:
 			return value
-		key, _ = datum.popitem()
-		raise DVRIPDecodeError('extra member {!r}'.format(key))
+		raise DVRIPDecodeError('extra member {!r}'
+		                       .format(next(iter(datum))))
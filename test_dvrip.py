@@ -3,28 +3,50 @@ from hypothesis import given
 from hypothesis.strategies import booleans, characters, integers, none, \
                                   sampled_from, text
 from io import BytesIO, RawIOBase
-from mock import Mock
+from mock import Mock, patch
 from pytest import fixture, raises
 from socket import socket as Socket
+from typing import Iterable
 
 # pylint: disable=wildcard-import,unused-wildcard-import
 from dvrip import DVRIP_PORT
 from dvrip.discover import _json_to_ip,  _json_to_mask, _ip_for_json, \
                            _mask_for_json
 from dvrip.errors import *
+from dvrip.files import File, FileType, GetFilesReply
 from dvrip.info import *
 from dvrip.info import _json_to_version, _version_for_json, _versiontype
 from dvrip.io import *
 from dvrip.log import *
 from dvrip.login import *
 from dvrip.message import *
-from dvrip.message import _ChunkReader, _datetime_for_json, EPOCH, \
-                          _json_to_datetime
+from dvrip.message import _datetime_for_json, EPOCH, _json_to_datetime
 from dvrip.packet import *
 from dvrip.packet import _mirrorproperty
 from dvrip.typing import *
 
 
+class _ChunkReader(RawIOBase):
+	def __init__(self, chunks: Iterable[bytes]) -> None:
+		super().__init__()
+		self.chunks = list(chunks)
+		self.chunks.reverse()
+	def readable(self) -> bool:
+		return True
+	def readinto(self, buffer: bytearray) -> int:
+		if not self.chunks:
+			return 0  # EOF
+		chunk = self.chunks[-1]
+		assert chunk
+		buffer[:len(chunk)] = chunk[:len(buffer)]
+		if len(chunk) > len(buffer):  # pylint: disable=no-else-return
+			self.chunks[-1] = chunk[len(buffer):]
+			return len(buffer)
+		else:
+			self.chunks.pop()
+			return len(chunk)
+
+
 def test_xmmd5_empty():
 	assert xmmd5('') == 'tlJwpbo6'
 
@@ -60,6 +82,10 @@ def test_json_to_datetime():
 	assert (_json_to_datetime('0000-00-00 00:00:00') == None)
 	with raises(DVRIPDecodeError, match='not a datetime string'):
 		_json_to_datetime('SPAM')
+	with raises(DVRIPDecodeError, match='not a datetime string'):
+		_json_to_datetime('2019-04-30T15:00:00')
+	with raises(DVRIPDecodeError, match='not a datetime string'):
+		_json_to_datetime('2019-04-30 15:00+01')
 	with raises(DVRIPDecodeError, match='datetime not after the epoch'):
 		_json_to_datetime('1999-01-01 00:00:00')
 
@@ -139,6 +165,10 @@ def test_Session_jsonto():
 		Session.json_to('SPAM')
 	with raises(DVRIPDecodeError, match="not a session ID"):
 		Session.json_to('0xSPAM')
+	with raises(DVRIPDecodeError, match="not a session ID"):
+		Session.json_to('0x')
+	with raises(DVRIPDecodeError, match="not a session ID"):
+		Session.json_to('0x-1')
 
 class PseudoSocket(RawIOBase):
 	def __init__(self, rfile, wfile):
@@ -170,6 +200,8 @@ def test_Hash_jsonto():
 	assert Hash.json_to('MD5') == Hash.XMMD5
 	with raises(DVRIPDecodeError, match='not a known hash function'):
 		Hash.json_to('SPAM')
+	with raises(DVRIPDecodeError, match='not a known hash function'):
+		Hash.json_to(57)
 
 @fixture
 def clitosrv():
@@ -523,8 +555,14 @@ def test_Info_forjson(cmd):
 @given(sampled_from(list(Info.__members__.values())))
 def test_info_jsonto(cmd):
 	assert Info.json_to(cmd.value) == cmd
-	with raises(DVRIPDecodeError, match='not a known'):
+	with raises(DVRIPDecodeError, match='not a known choice'):
 		Info.json_to('SPAM')
+	with raises(DVRIPDecodeError, match='not a known choice'):
+		Info.json_to(57)
+
+def test_GetInfo_slots():
+	request = GetInfo(command=Info.SYSTEM, session=Session(0x57))
+	assert not hasattr(request, '__dict__')
 
 octets = lambda: integers(min_value=0, max_value=255)
 
@@ -588,6 +626,13 @@ def test_ConnectionEntry_eq(auser, aservice, ahost, buser, bservice, bhost):
 	        (auser == buser and aservice == bservice and ahost == bhost))
 	assert ConnectionEntry(user=auser, service=aservice, host=ahost) != False
 
+@given(idtext(), idtext(), none() | idtext())
+def test_ConnectionEntry_hash(user, service, host):
+	a = ConnectionEntry(user=user, service=service, host=host)
+	b = ConnectionEntry(user=user, service=service, host=host)
+	assert a is not b and a == b and hash(a) == hash(b)
+	assert b in {a}
+
 @given(idtext(), idtext(), idtext())
 def test_ConnectionEntry_forjson(user, service, host):
 	assert (ConnectionEntry(user=user, service=service).for_json() ==
@@ -637,6 +682,13 @@ def test_RecordEntry_eq(achannel, atrigger, bchannel, btrigger):
 	        (achannel == bchannel and atrigger == btrigger))
 	assert RecordEntry(channel=achannel, trigger=atrigger) != False
 
+@given(integers(), sampled_from(RecordTrigger))
+def test_RecordEntry_hash(channel, trigger):
+	a = RecordEntry(channel=channel, trigger=trigger)
+	b = RecordEntry(channel=channel, trigger=trigger)
+	assert a is not b and a == b and hash(a) == hash(b)
+	assert b in {a}
+
 @given(integers(), sampled_from(RecordTrigger))
 def test_RecordEntry_forjson(channel, trigger):
 	assert (RecordEntry(channel=channel, trigger=trigger).for_json() ==
@@ -676,6 +728,8 @@ def test_EntryType_jsonto(value):
 	assert EntryType.json_to(value.value) == value
 	with raises(DVRIPDecodeError, match='not a known entry type'):
 		EntryType.json_to('Spam')
+	with raises(DVRIPDecodeError, match='not a known entry type'):
+		EntryType.json_to(57)
 
 @given(sampled_from(EntryType))
 def test_EntryType_forjson_jsonto(value):
@@ -684,3 +738,37 @@ def test_EntryType_forjson_jsonto(value):
 @given(sampled_from(EntryType))
 def test_EntryType_jsonto_forjson(value):
 	assert EntryType.json_to(value.value).for_json() == value.value
+
+@given(integers(), text())
+def test_Entry_repr(number, data):
+	entry = Entry(number=number, time=None, type=EntryType.SETTIME,
+	              data=data)
+	assert (repr(entry) ==
+	        'Entry(number={!r}, time=None, type=EntryType.SETTIME, '
+	        "_user='System', data={!r})".format(number, data))
+
+def test_Entry_slots():
+	entry = Entry(number=0, time=None, type=EntryType.SETTIME, data='')
+	assert not hasattr(entry, '__dict__')
+	query = LogQuery(start=EPOCH, end=EPOCH, offset=0)
+	request = GetLog(session=Session(0x57), logquery=query)
+	assert not hasattr(query, '__dict__')
+	assert not hasattr(request, '__dict__')
+	assert not hasattr(KeepAlive(session=Session(0x57)), '__dict__')
+
+def test_DVRIPClient_files(clinoconn):
+	def file(name, length):
+		return File(name=name, disk=0, part=0, length=length,
+		            start=EPOCH, end=EPOCH)
+	def reply(status, *files):
+		return GetFilesReply(status=status, command='OPFileQuery',
+		                     session=Session(0x57), files=list(files))
+	# Files only equal in start time and name are still distinct
+	a, b, c, d = file('a', 1), file('b', 2), file('b', 3), file('d', 4)
+	replies = [reply(Status.OK, a, b),
+	           reply(Status.OK, b, c),
+	           reply(Status.SRCHCOMP, c, d)]
+	with patch.object(DVRIPClient, 'request', side_effect=replies):
+		assert (list(clinoconn.files(start=EPOCH, end=EPOCH, channel=0,
+		                             type=FileType.VIDEO)) ==
+		        [a, b, c, d])
@@ -135,6 +135,9 @@ def test_list_jsonto(l):
 		json_to(List[int])({})
 	with raises(DVRIPDecodeError, match='not an integer'):
 		json_to(List[int])([False])
+	with raises(DVRIPDecodeError, match='not an integer'):
+		json_to(List[int])([*l, 'spam'])
+	assert json_to(List[int])(l) is not l
 	with raises(TypeError, match='no element type specified'):
 		json_to(list)(l)
 
@@ -200,6 +203,8 @@ def test_Member_subclasshook():
 @given(integers())
 def test_compose(i):
 	assert _compose(lambda x: x+1, lambda x: 2*x)(i) == 2*i + 1
+	assert _compose(abs) is abs
+	assert _compose()(i) == i
 
 def fromhex(value: object) -> bytes:
 	if not all(c in hexdigits for c in value):
@@ -234,6 +239,15 @@ def test_fixedmember_jsonto():
 	with raises(DVRIPDecodeError, match='not the fixed value'):
 		FixedExample.json_to({'Int': 58})
 
+def test_fixedmember_strsubclass():
+	class Key(str):
+		pass
+	class KeyExample(Object):
+		mstr: fixedmember = fixedmember(Key('Str'), Key('spam'))
+		mint: member[int] = member(Key('Int'))
+	assert KeyExample(mint=57).for_json() == {'Str': 'spam', 'Int': 57}
+	assert KeyExample.json_to({'Str': 'spam', 'Int': 57}).mint == 57
+
 class AbsentExample(Object):
 	mint: absentmember[int] = absentmember()
 
@@ -268,6 +282,30 @@ class ConflictExample(Object):
 def test_Object():
 	assert issubclass(Object, Value)
 
+def test_Object_slots():
+	assert set(Example.__slots__) == {'_value_mint', '_value_mhex'}
+	class SubExample(Example):
+		mstr: member[str] = member('Str')
+	assert SubExample.__slots__ == ('_value_mstr',)
+	assert not hasattr(Example(mint=0, mhex=b''), '__dict__')
+
+def test_Object_superinit():
+	class InitExample(Example):
+		__slots__ = ('note',)
+		mstr: member[str] = member('Str')
+		def __init__(self, *, note=None, **kwargs):
+			super().__init__(**kwargs)
+			self.note = note
+	class SubInitExample(InitExample):
+		mbool: member[bool] = member('Bool')
+	obj = InitExample(mint=1, mhex=b'\x02', mstr='3', note=4)
+	assert obj.mstr == '3' and obj.note == 4
+	assert (InitExample.json_to({'Int': 1, 'Hex': '02', 'Str': '3'}) ==
+	        InitExample(mint=1, mhex=b'\x02', mstr='3'))
+	sub = SubInitExample(mint=1, mhex=b'\x02', mstr='3', mbool=True)
+	assert sub.mbool is True and sub.note is None
+	assert SubInitExample.json_to(sub.for_json()) == sub
+
 @no_type_check
 def test_Member_nojsonto():
 	with raises(TypeError, match='no type or conversions specified'):
@@ -305,6 +343,8 @@ def test_Object_eq(i, b, j, c):
 	assert ((Example(mint=i, mhex=b) == Example(mint=j, mhex=c)) ==
 	         (i == j and b == c))
 	assert Example(mint=i, mhex=b) != Ellipsis
+	assert (Example(mint=i, mhex=b) !=
+	        NestedExample(mint=i, mobj=Example(mint=i, mhex=b)))
 
 @given(integers(), binary(), integers())
 def test_Object_forjson(i, b, j):
@@ -324,8 +364,28 @@ def test_Object_jsonto(i, h):
 		Example.json_to({'Int': i})
 	with raises(DVRIPDecodeError, match='no member'):
 		Example.json_to({'Hex': h})
-	with raises(DVRIPDecodeError, match='extra member'):
+	with raises(DVRIPDecodeError, match="extra member 'Extra'"):
 		Example.json_to({'Int': i, 'Hex': h, 'Extra': Ellipsis})
+	datum = {'Int': i, 'Hex': h}
+	Example.json_to(datum)
+	assert datum == {'Int': i, 'Hex': h}
+
+def test_Object_jsonto_builtins():
+	class BuiltinExample(Object):
+		len:        member[int] = member('Len')
+		isinstance: member[int] = optionalmember('IsInstance')
+		KeyError:   member[int] = member('KeyError')
+	obj = BuiltinExample(len=1, isinstance=2, KeyError=3)
+	assert BuiltinExample.json_to(obj.for_json()) == obj
+	with raises(DVRIPDecodeError, match="extra member 'Extra'"):
+		BuiltinExample.json_to({'Len': 1, 'KeyError': 3, 'Extra': 4})
+
+def test_Object_staticjsonto():
+	class StaticExample(Example):
+		@staticmethod
+		def json_to(datum):
+			return datum
+	assert json_to(StaticExample)(57) == 57
 
 @given(integers(), integers(), binary())
 def test_Object_forjson_jsonto(i, j, b):
@@ -361,3 +421,5 @@ def test_optionalmember_jsonto(i, j, k):
 	datum = {'Int1': i, 'Int3': k}
 	assert (OptionalExample.json_to(datum) ==
 	        OptionalExample(mint=i, nint=NotImplemented, kint=k))
+	with raises(DVRIPDecodeError, match="extra member 'Int4'"):
+		OptionalExample.json_to({'Int1': i, 'Int3': k, 'Int4': j})